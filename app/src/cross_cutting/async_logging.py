@@ -0,0 +1,161 @@
+import logging
+import os
+import queue
+import threading
+from typing import List, Optional
+
+
+class AsyncLogHandler(logging.Handler):
+    """Handler não bloqueante: enfileira os registros e uma thread em segundo plano os repassa em lote aos handlers de destino.
+
+    A mensagem é renderizada na thread que registra o log (como o QueueHandler.prepare), evitando que
+    alterações posteriores nos objetos apareçam no log. A fila é limitada; quando cheia, o registro é
+    descartado e contabilizado em `dropped`. `flush()` aguarda a thread esvaziar a fila, garantindo que
+    nenhuma linha se perca no freeze do Lambda.
+    """
+
+    def __init__(self, targets: List[logging.Handler], max_queue_size: int = 10000, batch_size: int = 512,
+                 level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.targets: List[logging.Handler] = targets
+        self.max_queue_size: int = max_queue_size
+        self.batch_size: int = batch_size
+        self.dropped: int = 0
+        self._reported_dropped: int = 0
+        self._drop_lock: threading.Lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._queue: "queue.Queue[logging.LogRecord]"
+        self._start_worker()
+
+    def _start_worker(self) -> None:
+        # Também chamado após um fork: o processo filho herda o handler, mas não a thread
+        self._pid = os.getpid()
+        self._queue = queue.Queue(maxsize=self.max_queue_size)
+        self._worker: threading.Thread = threading.Thread(target=self._run, name="AsyncLogHandler", daemon=True)
+        self._worker.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Congela a mensagem (e a exceção) no momento do log."""
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._pid != os.getpid():
+            self._start_worker()
+        try:
+            self._queue.put_nowait(self.prepare(record))
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+    def _run(self) -> None:
+        log_queue = self._queue
+        while True:
+            batch: List[logging.LogRecord] = [log_queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    log_queue.task_done()
+
+    def _write(self, batch: List[logging.LogRecord]) -> None:
+        with self._drop_lock:
+            dropped: int = self.dropped - self._reported_dropped
+            self._reported_dropped = self.dropped
+        if dropped:
+            batch = batch + [logging.makeLogRecord({
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"[AsyncLogHandler] {dropped} linhas de log descartadas (fila cheia)",
+            })]
+
+        for target in self.targets:
+            if type(target) is logging.StreamHandler:
+                self._write_stream(target, batch)
+            else:
+                # Handlers de terceiros (ex.: o do runtime do Lambda) mantêm o próprio formato
+                for record in batch:
+                    try:
+                        target.handle(record)
+                    except Exception:
+                        # Uma falha no destino não pode encerrar a thread de flush
+                        self.handleError(record)
+
+    @staticmethod
+    def _write_stream(target: logging.StreamHandler, batch: List[logging.LogRecord]) -> None:
+        """Formata o lote com o formatter do handler e grava tudo em uma única escrita."""
+        lines: List[str] = []
+        for record in batch:
+            if record.levelno >= target.level and target.filter(record):
+                try:
+                    lines.append(target.format(record))
+                except Exception:
+                    target.handleError(record)
+        if not lines:
+            return
+
+        target.acquire()
+        try:
+            target.stream.write(target.terminator.join(lines) + target.terminator)
+            target.stream.flush()
+        except Exception:
+            target.handleError(batch[-1])
+        finally:
+            target.release()
+
+    def flush(self) -> None:
+        """Bloqueia até que todos os registros enfileirados tenham sido repassados aos handlers de destino."""
+        if self._pid == os.getpid() and self._worker.is_alive():
+            self._queue.join()
+            # Descartes ocorridos após a última gravação em lote
+            if self.dropped != self._reported_dropped:
+                self._write([])
+        for target in self.targets:
+            target.flush()
+
+
+_installed_handler: Optional[AsyncLogHandler] = None
+_install_lock: threading.Lock = threading.Lock()
+
+
+def install_async_logging(level: int = logging.INFO, fmt: str = '%(message)s') -> AsyncLogHandler:
+    """Coloca o AsyncLogHandler na frente dos handlers do logger raiz (idempotente).
+
+    Os handlers já configurados (ex.: o do runtime do Lambda, com request id e formato próprio) passam a
+    receber os registros pela thread em segundo plano. Sem handlers, segue o basicConfig: cria um handler
+    de stderr com `fmt` e ajusta o nível do logger raiz para `level`.
+    """
+    global _installed_handler
+    with _install_lock:
+        if _installed_handler is None:
+            root = logging.getLogger()
+            targets: List[logging.Handler] = list(root.handlers)
+            if not targets:
+                # Mesmo destino do basicConfig (stderr)
+                stream_handler = logging.StreamHandler()
+                stream_handler.setFormatter(logging.Formatter(fmt))
+                targets.append(stream_handler)
+                root.setLevel(level)
+            for existing in targets:
+                root.removeHandler(existing)
+            _installed_handler = AsyncLogHandler(targets)
+            root.addHandler(_installed_handler)
+        return _installed_handler
+
+
+def flush_logs() -> None:
+    """Repassa as linhas pendentes; deve ser chamado antes do handler do Lambda retornar."""
+    if _installed_handler is not None:
+        _installed_handler.flush()
@@ -1,4 +1,6 @@
 # src/cross_cutting/dependency_container.py
+import os
+
 from dependency_injector import containers, providers
 from src.features.lambda_sink.infrastructure.database.mysql_connection import MySQLConnection
 #from src.features.lambda_sink.infrastructure.database.mysql_record_repository import MySQLRecordRepository
@@ -39,4 +41,6 @@ class DependencyContainer(containers.DeclarativeContainer):
     process_records_use_case = providers.Singleton(
         ProcessRecordsUseCase,
         repository=record_repository,
+        # SINK_DELETE_ON_INACTIVE_STATUS=true faz registros com status falso serem removidos
+        delete_on_inactive_status=os.getenv("SINK_DELETE_ON_INACTIVE_STATUS", "false").lower() in ("1", "true", "yes"),
     )
\ No newline at end of file
@@ -4,6 +4,8 @@ import json
 from functools import wraps
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
+from src.cross_cutting.async_logging import install_async_logging
+
 
 class LoggerInterface:
     """Interface de logger para seguir o princípio DIP (Dependency Inversion Principle)."""
@@ -21,7 +23,7 @@ class SimpleLogger(LoggerInterface):
         self.configure_logging()
 
     def configure_logging(self) -> None:
-        logging.basicConfig(level=logging.INFO, format='%(message)s')
+        install_async_logging(level=logging.INFO, fmt='%(message)s')
 
     def log_message(self, message: str) -> None:
         self._logger.info(message)
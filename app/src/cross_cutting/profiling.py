@@ -0,0 +1,148 @@
+import contextlib
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
+
+# Variáveis de ambiente que habilitam o profiling sob demanda
+PROFILE_ENV: str = "SINK_PROFILE"
+TRACEMALLOC_ENV: str = "SINK_PROFILE_TRACEMALLOC"
+TOP_N_ENV: str = "SINK_PROFILE_TOP_N"
+OUTPUT_ENV: str = "SINK_PROFILE_OUTPUT"
+
+# Header do evento que habilita o profiling para uma única invocação ("1", "true" ou "tracemalloc")
+PROFILE_HEADER: str = "x-sink-profile"
+
+_TRUE_VALUES: Tuple[str, ...] = ("1", "true", "yes", "tracemalloc")
+
+# Trechos do caminho dos arquivos usados para agrupar o tempo por camada
+_LAYERS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("mapper", ("domain/mappers",)),
+    ("use_case", ("application/use_cases",)),
+    ("repository", ("mysql_record_repository", "sql_query_builder", "column_encoders")),
+    ("connection", ("mysql_connection", "pymysql")),
+)
+
+_DEFAULT_TOP_N: int = 20
+
+_NULL_CONTEXT: ContextManager[None] = contextlib.nullcontext()
+
+
+def _is_true(value: Optional[str]) -> bool:
+    return value is not None and str(value).lower() in _TRUE_VALUES
+
+
+class ProfilingSession:
+    """Envolve uma invocação com cProfile (e opcionalmente tracemalloc) e emite um relatório top-N."""
+
+    def __init__(self, track_allocations: bool = False, top_n: int = _DEFAULT_TOP_N, output_path: Optional[str] = None) -> None:
+        self.track_allocations: bool = track_allocations
+        self.top_n: int = top_n
+        self.output_path: Optional[str] = output_path
+        self._profiler: cProfile.Profile = cProfile.Profile()
+        self._started_tracemalloc: bool = False
+        self._start_time: float = 0.0
+
+    def __enter__(self) -> 'ProfilingSession':
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._start_time = time.perf_counter()
+        self._profiler.enable()
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc_val: Optional[BaseException], exc_tb: Optional[Any]) -> None:
+        self._profiler.disable()
+        duration: float = time.perf_counter() - self._start_time
+        snapshot: Optional[tracemalloc.Snapshot] = None
+        traced: Tuple[int, int] = (0, 0)
+        if self.track_allocations and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            traced = tracemalloc.get_traced_memory()
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        try:
+            self._emit(self.build_report(duration, snapshot, traced))
+        except Exception as e:
+            # O profiling nunca deve derrubar a invocação
+            logging.error(f"Falha ao gerar relatório de profiling: {e}")
+
+    def build_report(self, duration: float, snapshot: Optional[tracemalloc.Snapshot], traced: Tuple[int, int]) -> str:
+        """Monta o relatório compacto: tempo por camada, funções mais caras e locais de alocação."""
+        stats = pstats.Stats(self._profiler)
+        lines: List[str] = [f"[profile] duração total: {duration:.4f}s"]
+
+        layer_times: Dict[str, float] = {name: 0.0 for name, _ in _LAYERS}
+        for (filename, _, _), (_, _, tottime, _, _) in stats.stats.items():
+            normalized: str = filename.replace(os.sep, "/")
+            for name, markers in _LAYERS:
+                if any(marker in normalized for marker in markers):
+                    layer_times[name] += tottime
+                    break
+        lines.append("[profile] tempo próprio por camada: " +
+                     ", ".join(f"{name}={seconds:.4f}s" for name, seconds in layer_times.items()))
+
+        buffer = io.StringIO()
+        stats.stream = buffer
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+        lines.append(f"[profile] top {self.top_n} funções (tempo acumulado):")
+        lines.extend(line for line in buffer.getvalue().splitlines()
+                     if line.strip() and not line.lstrip().startswith(("Ordered by", "List reduced")))
+
+        if snapshot is not None:
+            current, peak = traced
+            lines.append(f"[profile] memória rastreada: atual={current / 1024:.1f}KiB pico={peak / 1024:.1f}KiB")
+            lines.append(f"[profile] top {self.top_n} locais de alocação:")
+            snapshot = snapshot.filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ))
+            for stat in snapshot.statistics("lineno")[:self.top_n]:
+                lines.append(f"    {stat}")
+
+        return "\n".join(lines)
+
+    def _emit(self, report: str) -> None:
+        if self.output_path:
+            with open(self.output_path, "a", encoding="utf-8") as f:
+                f.write(report + "\n")
+        else:
+            logging.getLogger(__name__).warning(report)
+
+
+def _top_n() -> int:
+    # Um valor inválido não pode derrubar a invocação; volta ao padrão
+    try:
+        return max(int(os.environ.get(TOP_N_ENV, _DEFAULT_TOP_N)), 1)
+    except ValueError:
+        logging.error(f"Valor inválido em {TOP_N_ENV}; usando {_DEFAULT_TOP_N}")
+        return _DEFAULT_TOP_N
+
+
+def _event_profile_header(event: Any) -> Optional[str]:
+    """Lê o header de profiling do primeiro registro do evento (custo O(1))."""
+    try:
+        headers = event[0]["payload"].get("headers") or {}
+        return headers.get(PROFILE_HEADER)
+    except (IndexError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def profile_invocation(event: Any) -> ContextManager[Any]:
+    """Retorna a sessão de profiling quando habilitada por ambiente ou header; caso contrário um contexto nulo."""
+    env_value: Optional[str] = os.environ.get(PROFILE_ENV)
+    header_value: Optional[str] = None if _is_true(env_value) else _event_profile_header(event)
+    if not (_is_true(env_value) or _is_true(header_value)):
+        return _NULL_CONTEXT
+
+    track_allocations: bool = _is_true(os.environ.get(TRACEMALLOC_ENV)) or \
+        "tracemalloc" in (str(env_value).lower(), str(header_value).lower())
+    return ProfilingSession(
+        track_allocations=track_allocations,
+        top_n=_top_n(),
+        output_path=os.environ.get(OUTPUT_ENV),
+    )
@@ -1,16 +1,57 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
 from src.features.lambda_sink.domain.entities.sink_record import SinkRecord
 from src.features.lambda_sink.domain.interfaces.repository_interface import IRecordRepository
 
 
 class ProcessRecordsUseCase:
-    def __init__(self, repository: IRecordRepository):
+    def __init__(self, repository: IRecordRepository, delete_on_inactive_status: bool = False,
+                 raise_errors: bool = False):
         self.repository: IRecordRepository = repository
+        # Quando habilitado, registros com status falso são tratados como remoção (em vez de ignorados)
+        self.delete_on_inactive_status: bool = delete_on_inactive_status
+        # Quando habilitado, falhas são propagadas para quem chamou (o replay não pode avançar o checkpoint)
+        self.raise_errors: bool = raise_errors
+
+    def _resolve_key(self, key: Any) -> Optional[Tuple[Any, ...]]:
+        """Resolve a chave primária do registro, a mesma identidade usada no DELETE."""
+        try:
+            return self.repository.resolve_key(key=key, table_name="records")
+        except ValueError as ve:
+            # Chave inválida não se resolve em uma nova tentativa: registra e ignora
+            logging.error(f"Validação falhou: {ve}")
+            return None
 
-    def execute(self, records: SinkRecord):
+    def _is_delete(self, record: SinkRecord) -> bool:
+        return record.is_tombstone or (self.delete_on_inactive_status and not record.value.status)
+
+    def _flush_deletes(self, pending_deletes: Dict[Tuple[Any, ...], Any]) -> None:
+        if pending_deletes:
+            self.repository.delete_many(keys=list(pending_deletes.values()), table_name="records")
+            pending_deletes.clear()
+
+    def execute(self, records: List[SinkRecord]):
         try:
+            # Remoções são acumuladas (por chave primária) e aplicadas em lote; antes de um upsert de
+            # uma chave com remoção pendente, o lote é aplicado para manter a ordem dentro do batch
+            pending_deletes: Dict[Tuple[Any, ...], Any] = {}
             for record in records:
-                if record.value.status:
+                if self._is_delete(record):
+                    key: Any = record.key if record.is_tombstone else record.value.__dict__
+                    primary_key: Optional[Tuple[Any, ...]] = self._resolve_key(key)
+                    if primary_key is not None:
+                        pending_deletes[primary_key] = key
+                elif record.value.status:
+                    # Sem chave resolvida não há como comparar; aplica as remoções pendentes por segurança
+                    primary_key = self._resolve_key(record.value.__dict__) if pending_deletes else None
+                    if pending_deletes and (primary_key is None or primary_key in pending_deletes):
+                        self._flush_deletes(pending_deletes)
                     self.repository.upsert(record=record.value.__dict__, table_name="records")
 
+            self._flush_deletes(pending_deletes)
+
         except Exception as e:
-            print(e)
\ No newline at end of file
+            if self.raise_errors:
+                raise
+            print(e)
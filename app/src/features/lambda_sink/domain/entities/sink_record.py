@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any, Optional
 
 from src.features.lambda_sink.domain.entities.record_value import RecordValue
 
@@ -8,7 +9,12 @@ class SinkRecord:
     topic: str
     partition: int
     offset: int
-    key: str
-    value: RecordValue
+    key: Any
+    value: Optional[RecordValue]
     headers: dict
-    timestamp: str
\ No newline at end of file
+    timestamp: str
+
+    @property
+    def is_tombstone(self) -> bool:
+        """Tombstones do Kafka (value nulo) representam a remoção da chave."""
+        return self.value is None
\ No newline at end of file
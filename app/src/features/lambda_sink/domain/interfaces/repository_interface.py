@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, List, Tuple
 
 from src.features.lambda_sink.domain.entities.record_value import RecordValue
 
@@ -7,3 +8,11 @@ class IRecordRepository(ABC):
     @abstractmethod
     def upsert(self, record: RecordValue, table_name: str) -> None:
         pass
+
+    @abstractmethod
+    def resolve_key(self, key: Any, table_name: str) -> Tuple[Any, ...]:
+        pass
+
+    @abstractmethod
+    def delete_many(self, keys: List[Any], table_name: str) -> None:
+        pass
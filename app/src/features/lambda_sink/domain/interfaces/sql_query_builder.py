@@ -10,4 +10,8 @@ class ISQLQueryBuilder(ABC):
     @abstractmethod
     def build_update_query(self, table_name: str, record: Dict[str, Any], primary_keys: List[str], metadata: List[Dict[str, Any]]) -> str:
 
+        pass
+
+    @abstractmethod
+    def build_delete_query(self, table_name: str, primary_keys: List[str], key_count: int) -> str:
         pass
\ No newline at end of file
@@ -5,7 +5,9 @@ from src.features.lambda_sink.domain.entities.sink_record import SinkRecord
 class EventMapper:
     @staticmethod
     def map_event_to_sink_record(payload: dict) -> SinkRecord:
-        value = RecordValue(**payload['value']["data"])
+        # Tombstones chegam com value (ou value.data) nulo
+        data = (payload.get('value') or {}).get("data")
+        value = RecordValue(**data) if data is not None else None
         return SinkRecord(
             topic=payload['topic'],
             partition=payload['partition'],
@@ -0,0 +1,175 @@
+import json
+import re
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List
+
+from pymysql.converters import escape_item, escape_string
+
+# Converte um valor Python/JSON diretamente no literal SQL da coluna
+ColumnEncoder = Callable[[Any], str]
+
+_TYPE_NAME_PATTERN = re.compile(r"^\s*([a-z]+)")
+
+# tinyint(1) é apenas largura de exibição: também é codificado como inteiro (True/False -> 1/0)
+_INTEGER_TYPES = frozenset({"tinyint", "smallint", "mediumint", "int", "integer", "bigint", "year", "bool", "boolean"})
+_DECIMAL_TYPES = frozenset({"decimal", "numeric", "dec", "fixed"})
+_FLOAT_TYPES = frozenset({"float", "double", "real"})
+_DATETIME_TYPES = frozenset({"datetime", "timestamp"})
+
+# Tipos cujo literal gerado pelo pymysql não contém texto escapado (bytes viram hexadecimal)
+_LITERAL_TYPES = (bool, int, float, Decimal, bytes, date, time, timedelta)
+
+_FALLBACK_CHARSET: str = "utf8mb4"
+
+
+def _quote_backslash(value: str) -> str:
+    return "'" + escape_string(value) + "'"
+
+
+def _quote_no_backslash(value: str) -> str:
+    # Mesmo tratamento do pymysql quando o servidor usa NO_BACKSLASH_ESCAPES
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _parse_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        parsed: datetime = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        try:
+            parsed = datetime.fromtimestamp(value, tz=timezone.utc)
+        except (OverflowError, OSError, ValueError):
+            raise ValueError(f"Valor {value!r} não é um epoch válido.") from None
+    elif isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.strip())
+        except ValueError:
+            raise ValueError(f"Valor {value!r} não é uma data/hora ISO 8601 válida.") from None
+    else:
+        raise ValueError(f"Valor {value!r} não pode ser convertido para data/hora.")
+    return parsed
+
+
+def _encode_integer(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    # Truncar 12.7 para 12 corromperia o dado sem erro (o MySQL arredondaria)
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"Valor {value!r} não é um inteiro válido.")
+    try:
+        return str(int(value))
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"Valor {value!r} não é um inteiro válido.") from None
+
+
+def _encode_decimal(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    try:
+        number: Decimal = value if isinstance(value, Decimal) else Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError(f"Valor {value!r} não é um decimal válido.") from None
+    if not number.is_finite():
+        raise ValueError(f"Valor {value!r} não é um decimal finito.")
+    return str(number)
+
+
+def _encode_float(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    try:
+        number: float = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Valor {value!r} não é um número válido.") from None
+    if number != number or number in (float("inf"), float("-inf")):
+        raise ValueError(f"Valor {value!r} não é um número finito.")
+    return repr(number)
+
+
+def _encode_datetime(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    parsed: datetime = _parse_datetime(value)
+    aware: bool = parsed.tzinfo is not None
+    if aware:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    literal: str = parsed.strftime("'%Y-%m-%d %H:%M:%S.%f'" if parsed.microsecond else "'%Y-%m-%d %H:%M:%S'")
+    # Literais são lidos no time_zone da sessão; valores com fuso são convertidos de UTC para ele no servidor
+    if aware:
+        return f"CONVERT_TZ({literal}, '+00:00', @@session.time_zone)"
+    return literal
+
+
+def _encode_date(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return value.strftime("'%Y-%m-%d'")
+    # A data é a do próprio valor, sem reinterpretar o fuso
+    return _parse_datetime(value).strftime("'%Y-%m-%d'")
+
+
+def _generic_encoder(quote: Callable[[str], str]) -> ColumnEncoder:
+    def encode(value: Any) -> str:
+        if value is None:
+            return "NULL"
+        # Todo texto passa pelo quote do modo da sessão (NO_BACKSLASH_ESCAPES)
+        if isinstance(value, str):
+            return quote(value)
+        if isinstance(value, bytearray):
+            value = bytes(value)
+        if isinstance(value, _LITERAL_TYPES):
+            return escape_item(value, _FALLBACK_CHARSET)
+        raise ValueError(f"Valor {value!r} do tipo {type(value).__name__} não é suportado pela coluna.")
+    return encode
+
+
+def _json_encoder(quote: Callable[[str], str]) -> ColumnEncoder:
+    def encode(value: Any) -> str:
+        if value is None:
+            return "NULL"
+        # Strings são consideradas JSON já serializado
+        if isinstance(value, str):
+            return quote(value)
+        try:
+            # O MySQL rejeita NaN/Infinity em colunas JSON
+            return quote(json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False))
+        except (TypeError, ValueError):
+            raise ValueError(f"Valor {value!r} não é serializável como JSON.") from None
+    return encode
+
+
+def _build_encoder(column_type: str, quote: Callable[[str], str]) -> ColumnEncoder:
+    match = _TYPE_NAME_PATTERN.match(column_type.lower())
+    if not match:
+        return _generic_encoder(quote)
+    type_name: str = match.group(1)
+
+    if type_name in _INTEGER_TYPES:
+        return _encode_integer
+    if type_name in _DECIMAL_TYPES:
+        return _encode_decimal
+    if type_name in _FLOAT_TYPES:
+        return _encode_float
+    if type_name in _DATETIME_TYPES:
+        return _encode_datetime
+    if type_name == "date":
+        return _encode_date
+    if type_name == "json":
+        return _json_encoder(quote)
+    # Texto (char, varchar, text, enum...), binários e demais tipos
+    return _generic_encoder(quote)
+
+
+def compile_column_encoders(metadata: List[Dict[str, Any]], no_backslash_escapes: bool = False) -> Dict[str, ColumnEncoder]:
+    """Compila um encoder por coluna a partir dos tipos retornados pelo DESCRIBE."""
+    quote: Callable[[str], str] = _quote_no_backslash if no_backslash_escapes else _quote_backslash
+    return {field['name']: _build_encoder(field.get('type') or '', quote) for field in metadata}
@@ -3,8 +3,12 @@ from src.features.lambda_sink.domain.interfaces.database_connection_interface im
 from src.features.lambda_sink.domain.interfaces.secret_manager_interface import ISecretManager
 from pymysql.connections import Connection
 import pymysql
+import time
 from typing import Optional, Any, Dict
 
+# Tempo ocioso após o qual a conexão persistente é verificada (ping) antes de ser reutilizada
+PING_IDLE_SECONDS: float = 30.0
+
 
 class MySQLConnection(IDatabaseConnection):
     def __init__(self, secret_manager: ISecretManager) -> None:
@@ -39,3 +43,40 @@ class MySQLConnection(IDatabaseConnection):
     def __exit__(self, exc_type: Optional[type], exc_val: Optional[Exception], exc_tb: Optional[Any]) -> None:
         if self.connection:
             self.connection.close()
+
+
+class _NonClosingConnection:
+    """Proxy da conexão que ignora close(), permitindo reutilizá-la entre chamadas do repositório."""
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection: Connection = connection
+
+    def close(self) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+
+class PersistentMySQLConnection(MySQLConnection):
+    """Mantém uma única conexão aberta por processo (usada pelo replay offline)."""
+
+    def __init__(self, secret_manager: ISecretManager) -> None:
+        super().__init__(secret_manager)
+        self._shared: Optional[Connection] = None
+        self._last_used: float = 0.0
+
+    def get_connection(self) -> Connection:
+        now: float = time.monotonic()
+        if self._shared is None:
+            self._shared = super().get_connection()
+        elif not self._shared.open or now - self._last_used >= PING_IDLE_SECONDS:
+            # Reabre a conexão apenas se foi fechada após um erro ou ficou ociosa (evita um round trip por chamada)
+            self._shared.ping(reconnect=True)
+        self._last_used = now
+        return _NonClosingConnection(self._shared)
+
+    def close(self) -> None:
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
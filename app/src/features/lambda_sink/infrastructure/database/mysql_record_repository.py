@@ -1,15 +1,46 @@
+import json
 import pymysql
 import logging
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 from src.features.lambda_sink.domain.interfaces.database_connection_interface import IDatabaseConnection
 from src.features.lambda_sink.domain.interfaces.sql_query_builder import ISQLQueryBuilder
+from src.features.lambda_sink.infrastructure.database.column_encoders import ColumnEncoder, compile_column_encoders
 from pymysql.connections import Connection
+from pymysql.constants import SERVER_STATUS
+
+# Quantidade máxima de chaves por comando DELETE ... WHERE pk IN (...)
+DELETE_BATCH_SIZE: int = 500
+
 
 class MySQLRecordRepository:
-    def __init__(self, db_connection: IDatabaseConnection, query_builder: ISQLQueryBuilder) -> None:
+    def __init__(self, db_connection: IDatabaseConnection, query_builder: ISQLQueryBuilder,
+                 raise_errors: bool = False) -> None:
         self.db_connection: IDatabaseConnection = db_connection
         self.query_builder: ISQLQueryBuilder = query_builder
+        # Quando habilitado, falhas de escrita/conexão são propagadas após o log (usado pelo replay offline);
+        # falhas de validação são determinísticas e, como no Lambda, apenas registradas e ignoradas
+        self.raise_errors: bool = raise_errors
+        # Encoders compilados por tabela (e pela assinatura de colunas/tipos, para refletir alterações de schema)
+        self._encoders: Dict[Tuple[Any, ...], Dict[str, ColumnEncoder]] = {}
+        # Chaves primárias e encoders da última leitura de metadados de cada tabela (usados por resolve_key)
+        self._table_keys: Dict[str, Tuple[List[str], Dict[str, ColumnEncoder]]] = {}
+
+    def _get_encoders(self, table_name: str, metadata: List[Dict[str, Any]], connection: Connection) -> Dict[str, ColumnEncoder]:
+        """Retorna os encoders de coluna da tabela, compilando-os apenas na primeira vez."""
+        no_backslash_escapes: bool = bool(
+            getattr(connection, 'server_status', 0) & SERVER_STATUS.SERVER_STATUS_NO_BACKSLASH_ESCAPES
+        )
+        cache_key: Tuple[Any, ...] = (
+            table_name,
+            no_backslash_escapes,
+            tuple((field['name'], field.get('type')) for field in metadata)
+        )
+        encoders = self._encoders.get(cache_key)
+        if encoders is None:
+            encoders = compile_column_encoders(metadata, no_backslash_escapes)
+            self._encoders[cache_key] = encoders
+        return encoders
 
     def _validate_fields(self, record: Dict[str, Any], metadata: List[Dict[str, Any]]) -> None:
         """Valida os campos obrigatórios no record, exceto aqueles com valores gerados automaticamente."""
@@ -39,8 +70,10 @@ class MySQLRecordRepository:
                 cursor.execute(f"DESCRIBE {table_name}")
                 metadata: List[Dict[str, Any]] = []
                 for column in cursor.fetchall():
+                    column_type: Any = column[1]
                     metadata.append({
                         'name': column[0],
+                        'type': column_type.decode() if isinstance(column_type, bytes) else column_type,
                         'null': column[2] == 'YES',
                         'default': column[4],  # Captura o valor padrão
                         'extra': column[5]  # Captura 'auto_increment' ou 'on update CURRENT_TIMESTAMP'
@@ -54,7 +87,8 @@ class MySQLRecordRepository:
         finally:
             connection.close()
 
-    def record_exists(self, table_name: str, primary_keys: List[str], record: Dict[str, Any]) -> bool:
+    def record_exists(self, table_name: str, primary_keys: List[str], record: Dict[str, Any],
+                      encoders: Optional[Dict[str, ColumnEncoder]] = None) -> bool:
         """Verifica se um registro existe baseado nas colunas de chave primária."""
         connection: Connection = self.db_connection.get_connection()
         try:
@@ -66,7 +100,11 @@ class MySQLRecordRepository:
             key_values: Tuple[Any, ...] = tuple(record[key] for key in primary_keys)
 
             with connection.cursor() as cursor:
-                cursor.execute(exists_query, key_values)
+                if encoders is not None:
+                    # Valores já convertidos em literais SQL pelos encoders da coluna
+                    cursor.execute(exists_query % tuple(encoders[key](value) for key, value in zip(primary_keys, key_values)))
+                else:
+                    cursor.execute(exists_query, key_values)
                 return cursor.fetchone()[0] > 0
         finally:
             connection.close()
@@ -75,30 +113,34 @@ class MySQLRecordRepository:
         connection: Connection = self.db_connection.get_connection()
         try:
             metadata, primary_keys = self.get_table_metadata(table_name)
+            encoders: Dict[str, ColumnEncoder] = self._get_encoders(table_name, metadata, connection)
+            self._table_keys[table_name] = (primary_keys, encoders)
 
-            # Monta os valores (exclui as chaves primárias no caso do UPDATE)
-            values: Tuple[Any, ...] = tuple(record[field['name']] for field in metadata if
+            # Monta os valores já codificados como literais SQL (exclui as chaves primárias no caso do UPDATE)
+            values: Tuple[str, ...] = tuple(encoders[field['name']](record[field['name']]) for field in metadata if
                            field['name'] in record and field['name'] not in primary_keys)
 
             # Verifica se o registro existe
-            if self.record_exists(table_name, primary_keys, record):
+            if self.record_exists(table_name, primary_keys, record, encoders):
                 # Validação para UPDATE: deve garantir que todas as chaves primárias estão no record
                 for key in primary_keys:
                     if key not in record:
                         raise ValueError(f"O campo {key} é obrigatório para atualização.")
                 sql: str = self.query_builder.build_update_query(table_name, record, primary_keys, metadata)
-                values += tuple(record[key] for key in primary_keys)
+                values += tuple(encoders[key](record[key]) for key in primary_keys)
             else:
                 # Validação para INSERT
                 self._validate_fields(record, metadata)
                 sql: str = self.query_builder.build_insert_query(table_name, record, primary_keys, metadata)
 
             with connection.cursor() as cursor:
-                cursor.execute(sql, values)
+                cursor.execute(sql % values)
             connection.commit()
         except pymysql.MySQLError as e:
             logging.error(f"Erro ao salvar o registro: {e}")
             connection.rollback()
+            if self.raise_errors:
+                raise
         except ValueError as ve:
             logging.error(f"Validação falhou: {ve}")
         except Exception as e:
@@ -106,3 +148,78 @@ class MySQLRecordRepository:
             raise e
         finally:
             connection.close()
+
+    def _key_values(self, key: Any, primary_keys: List[str]) -> Optional[Tuple[Any, ...]]:
+        """Converte a chave recebida (dict, JSON ou valor escalar) nos valores das chaves primárias."""
+        if isinstance(key, str) and key.lstrip().startswith('{'):
+            try:
+                key = json.loads(key)
+            except json.JSONDecodeError:
+                pass
+
+        if isinstance(key, dict):
+            missing: List[str] = [pk for pk in primary_keys if pk not in key]
+            if missing:
+                raise ValueError(f"Chave {key!r} sem os campos de chave primária {missing}.")
+            return tuple(key[pk] for pk in primary_keys)
+
+        if key is None:
+            raise ValueError("Chave nula não identifica o registro a ser removido.")
+        if len(primary_keys) != 1:
+            raise ValueError(f"Chave escalar {key!r} não atende à chave primária composta {primary_keys}.")
+        return (key,)
+
+    def _encode_key(self, key: Any, primary_keys: List[str], encoders: Dict[str, ColumnEncoder]) -> Tuple[str, ...]:
+        return tuple(encoders[pk](value) for pk, value in zip(primary_keys, self._key_values(key, primary_keys)))
+
+    def resolve_key(self, key: Any, table_name: str) -> Tuple[str, ...]:
+        """Resolve a chave (record, dict, JSON ou escalar) na tupla de chave primária usada no DELETE."""
+        cached = self._table_keys.get(table_name)
+        if cached is None:
+            connection: Connection = self.db_connection.get_connection()
+            try:
+                metadata, primary_keys = self.get_table_metadata(table_name)
+                cached = (primary_keys, self._get_encoders(table_name, metadata, connection))
+                self._table_keys[table_name] = cached
+            finally:
+                connection.close()
+        primary_keys, encoders = cached
+        return self._encode_key(key, primary_keys, encoders)
+
+    def delete_many(self, keys: List[Any], table_name: str) -> None:
+        """Remove os registros em lote com DELETE ... WHERE pk IN (...)."""
+        if not keys:
+            return
+
+        connection: Connection = self.db_connection.get_connection()
+        try:
+            metadata, primary_keys = self.get_table_metadata(table_name)
+            encoders: Dict[str, ColumnEncoder] = self._get_encoders(table_name, metadata, connection)
+            self._table_keys[table_name] = (primary_keys, encoders)
+
+            # Codifica as chaves, descarta as inválidas individualmente e remove duplicadas preservando a ordem
+            key_values: Dict[Tuple[str, ...], None] = {}
+            for key in keys:
+                try:
+                    key_values[self._encode_key(key, primary_keys, encoders)] = None
+                except ValueError as ve:
+                    logging.error(f"Validação falhou: {ve}")
+            unique_keys: List[Tuple[str, ...]] = list(key_values)
+
+            with connection.cursor() as cursor:
+                for start in range(0, len(unique_keys), DELETE_BATCH_SIZE):
+                    chunk: List[Tuple[str, ...]] = unique_keys[start:start + DELETE_BATCH_SIZE]
+                    sql: str = self.query_builder.build_delete_query(table_name, primary_keys, len(chunk))
+                    values: Tuple[str, ...] = tuple(value for key in chunk for value in key)
+                    cursor.execute(sql % values)
+            connection.commit()
+        except pymysql.MySQLError as e:
+            logging.error(f"Erro ao remover os registros: {e}")
+            connection.rollback()
+            if self.raise_errors:
+                raise
+        except Exception as e:
+            connection.rollback()
+            raise e
+        finally:
+            connection.close()
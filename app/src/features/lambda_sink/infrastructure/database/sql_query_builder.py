@@ -71,3 +71,21 @@ class SimpleSQLQueryBuilder(ISQLQueryBuilder):
         where_clause: str = ' AND '.join([f"{pk} = %s" for pk in primary_keys])
 
         return f"UPDATE {table_name} SET {update_clause} WHERE {where_clause}"
+
+    def build_delete_query(
+        self,
+        table_name: str,
+        primary_keys: List[str],
+        key_count: int
+    ) -> str:
+        """Gera um DELETE multi-chave (WHERE pk IN (...)), suportando chaves primárias compostas."""
+        if len(primary_keys) == 1:
+            column_str: str = primary_keys[0]
+            placeholder: str = '%s'
+        else:
+            column_str = f"({', '.join(primary_keys)})"
+            placeholder = f"({', '.join(['%s'] * len(primary_keys))})"
+
+        placeholders_str: str = ', '.join([placeholder] * key_count)
+
+        return f"DELETE FROM {table_name} WHERE {column_str} IN ({placeholders_str})"
@@ -1,11 +1,27 @@
 import json
 import logging
+from src.cross_cutting.async_logging import flush_logs, install_async_logging
 from src.cross_cutting.container.dependency_container import DependencyContainer
+from src.cross_cutting.profiling import profile_invocation
 from src.features.lambda_sink.domain.entities.sink_record import SinkRecord
 from src.features.lambda_sink.domain.mappers.mappers import EventMapper
 from typing import List
 
+# Logs emitidos por uma thread em segundo plano, fora do caminho da requisição
+install_async_logging()
+
+
 def lambda_handler(event: dict, context) -> dict:
+    try:
+        # Profiling sob demanda (SINK_PROFILE ou header x-sink-profile); sem custo quando desabilitado
+        with profile_invocation(event):
+            return _handle(event, context)
+    finally:
+        # Garante que as linhas enfileiradas sejam gravadas antes do freeze do Lambda
+        flush_logs()
+
+
+def _handle(event: dict, context) -> dict:
     container = DependencyContainer()
     use_case = container.process_records_use_case()
 
@@ -0,0 +1,294 @@
+"""Replay/backfill offline de dumps JSONL de tópicos.
+
+Reaproveita o mesmo mapeamento (EventMapper), caso de uso e repositório do
+lambda_handler, sem os limites de batch do Lambda. Uso (a partir de app/):
+
+    python -m src.features.lambda_sink.presentation.replay_cli dump1.jsonl dump2.jsonl \
+        --workers 4 --batch-size 500 --checkpoint replay_checkpoint.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from dependency_injector import providers
+
+from src.cross_cutting.async_logging import flush_logs
+from src.cross_cutting.container.dependency_container import DependencyContainer
+from src.features.lambda_sink.domain.entities.sink_record import SinkRecord
+from src.features.lambda_sink.domain.mappers.mappers import EventMapper
+from src.features.lambda_sink.infrastructure.database.mysql_connection import PersistentMySQLConnection
+
+PartitionKey = Tuple[str, int]
+
+_PUT_TIMEOUT_SECONDS: float = 0.5
+_JOIN_TIMEOUT_SECONDS: float = 30.0
+
+
+def _checkpoint_key(topic: str, partition: int) -> str:
+    return f"{topic}:{partition}"
+
+
+def load_checkpoint(path: str) -> Dict[str, int]:
+    """Carrega o último offset processado por tópico/partição."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return {key: int(offset) for key, offset in json.load(f).items()}
+
+
+def save_checkpoint(path: str, checkpoint: Dict[str, int]) -> None:
+    """Grava o checkpoint de forma atômica (arquivo temporário + rename)."""
+    tmp_path: str = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, sort_keys=True)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def iter_payloads(paths: List[str]) -> Iterator[Dict[str, Any]]:
+    """Lê os arquivos JSONL linha a linha, aceitando tanto {"payload": {...}} quanto o payload puro."""
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event: Dict[str, Any] = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}:{line_number}: JSON inválido: {e}") from e
+                yield event.get("payload", event)
+
+
+def _worker(worker_id: int, input_queue: multiprocessing.Queue, progress_queue: multiprocessing.Queue) -> None:
+    """Processa os batches das partições atribuídas a este worker com uma única conexão."""
+    container = DependencyContainer()
+    container.db_connection.override(
+        providers.Singleton(PersistentMySQLConnection, secret_manager=container.secret_manager)
+    )
+    # No replay, falhas de escrita/conexão interrompem o worker para que o batch não entre no checkpoint
+    container.record_repository.add_kwargs(raise_errors=True)
+    container.process_records_use_case.add_kwargs(raise_errors=True)
+    use_case = container.process_records_use_case()
+
+    try:
+        while True:
+            batch: Optional[List[Dict[str, Any]]] = input_queue.get()
+            if batch is None:
+                break
+
+            records: List[SinkRecord] = [
+                EventMapper.map_event_to_sink_record(payload=payload) for payload in batch
+            ]
+            use_case.execute(records=records)
+
+            last: Dict[str, Any] = batch[-1]
+            progress_queue.put(("progress", worker_id, last["topic"], last["partition"], last["offset"], len(batch)))
+    except Exception as e:
+        progress_queue.put(("error", worker_id, f"{type(e).__name__}: {e}"))
+    else:
+        progress_queue.put(("done", worker_id))
+    finally:
+        container.db_connection().close()
+        # Processos filhos encerram sem atexit; grava os logs pendentes
+        flush_logs()
+
+
+class ReplayRunner:
+    """Distribui os registros por partição entre processos, controla checkpoint e throughput."""
+
+    def __init__(self, paths: List[str], workers: int, batch_size: int, checkpoint_path: str,
+                 checkpoint_interval: float, report_interval: float) -> None:
+        self.paths: List[str] = paths
+        self.workers: int = workers
+        self.batch_size: int = batch_size
+        self.checkpoint_path: str = checkpoint_path
+        self.checkpoint_interval: float = checkpoint_interval
+        self.report_interval: float = report_interval
+
+        self.checkpoint: Dict[str, int] = load_checkpoint(checkpoint_path)
+        self._assignment: Dict[PartitionKey, int] = {}
+        self._buffers: Dict[PartitionKey, List[Dict[str, Any]]] = {}
+        self._errors: List[str] = []
+        self._failed_workers: Set[int] = set()
+        self._processes: List[multiprocessing.Process] = []
+        self._done: int = 0
+        self._processed: int = 0
+        self._skipped: int = 0
+        self._started_at: float = 0.0
+        self._last_report: float = 0.0
+        self._last_save: float = 0.0
+
+    def run(self) -> int:
+        ctx = multiprocessing.get_context()
+        self._progress_queue: multiprocessing.Queue = ctx.Queue()
+        self._input_queues: List[multiprocessing.Queue] = [ctx.Queue(maxsize=4) for _ in range(self.workers)]
+        processes = self._processes = [
+            ctx.Process(target=_worker, args=(i, self._input_queues[i], self._progress_queue), daemon=True)
+            for i in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        self._started_at = self._last_report = self._last_save = time.monotonic()
+        try:
+            for payload in iter_payloads(self.paths):
+                if self._errors:
+                    break
+                self._route(payload)
+            else:
+                for partition_key in list(self._buffers):
+                    self._dispatch(partition_key)
+        finally:
+            self._stop_workers(processes)
+            save_checkpoint(self.checkpoint_path, self.checkpoint)
+            self._report(final=True)
+
+        for error in self._errors:
+            print(f"Erro no replay: {error}", file=sys.stderr)
+        return 1 if self._errors else 0
+
+    def _stop_workers(self, processes: List[multiprocessing.Process]) -> None:
+        """Envia o sinal de parada e aguarda os workers concluírem os batches pendentes."""
+        pending: List[int] = list(range(self.workers))
+        while pending:
+            worker_id: int = pending.pop(0)
+            if not processes[worker_id].is_alive():
+                self._worker_died(worker_id)
+                continue
+            try:
+                self._input_queues[worker_id].put(None, timeout=_PUT_TIMEOUT_SECONDS)
+            except queue.Full:
+                pending.append(worker_id)
+            self._drain_progress()
+
+        while self._done + len(self._failed_workers) < self.workers:
+            try:
+                self._handle_message(self._progress_queue.get(timeout=_PUT_TIMEOUT_SECONDS))
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    break
+
+        for process in processes:
+            process.join(timeout=_JOIN_TIMEOUT_SECONDS)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        # Batches deixados na fila de um worker encerrado nunca serão lidos; sem isso a
+        # thread alimentadora da fila bloqueia o encerramento do interpretador
+        for input_queue in self._input_queues:
+            input_queue.cancel_join_thread()
+            input_queue.close()
+        self._drain_progress()
+
+    def _route(self, payload: Dict[str, Any]) -> None:
+        partition_key: PartitionKey = (payload["topic"], payload["partition"])
+        committed: Optional[int] = self.checkpoint.get(_checkpoint_key(*partition_key))
+        if committed is not None and payload["offset"] <= committed:
+            self._skipped += 1
+            return
+
+        buffer = self._buffers.setdefault(partition_key, [])
+        buffer.append(payload)
+        if len(buffer) >= self.batch_size:
+            self._dispatch(partition_key)
+
+    def _dispatch(self, partition_key: PartitionKey) -> None:
+        batch = self._buffers.pop(partition_key, None)
+        if not batch:
+            return
+
+        # Cada partição fica fixa em um worker para preservar a ordem dos offsets
+        worker_id: int = self._assignment.setdefault(partition_key, len(self._assignment) % self.workers)
+        while True:
+            self._drain_progress()
+            if self._errors:
+                return
+            if not self._processes[worker_id].is_alive():
+                # Worker encerrado sem reportar (OOM, sinal, falha na inicialização): a fila nunca esvaziaria
+                self._worker_died(worker_id)
+                return
+            try:
+                self._input_queues[worker_id].put(batch, timeout=_PUT_TIMEOUT_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def _worker_died(self, worker_id: int) -> None:
+        """Registra como erro a morte de um worker que não enviou "error" nem "done"."""
+        self._drain_progress()
+        if worker_id not in self._failed_workers and self._processes[worker_id].exitcode != 0:
+            self._failed_workers.add(worker_id)
+            self._errors.append(f"worker {worker_id} morreu (exitcode={self._processes[worker_id].exitcode})")
+
+    def _drain_progress(self) -> None:
+        while True:
+            try:
+                message = self._progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._handle_message(message)
+
+        now: float = time.monotonic()
+        if now - self._last_save >= self.checkpoint_interval:
+            save_checkpoint(self.checkpoint_path, self.checkpoint)
+            self._last_save = now
+        if now - self._last_report >= self.report_interval:
+            self._report()
+            self._last_report = now
+
+    def _handle_message(self, message: Tuple[Any, ...]) -> None:
+        kind = message[0]
+        if kind == "progress":
+            _, _, topic, partition, offset, count = message
+            self.checkpoint[_checkpoint_key(topic, partition)] = offset
+            self._processed += count
+        elif kind == "done":
+            self._done += 1
+        elif kind == "error":
+            self._failed_workers.add(message[1])
+            self._errors.append(f"worker {message[1]}: {message[2]}")
+
+    def _report(self, final: bool = False) -> None:
+        elapsed: float = max(time.monotonic() - self._started_at, 1e-9)
+        line: str = (f"processados={self._processed} ignorados={self._skipped} "
+                     f"tempo={elapsed:.1f}s taxa={self._processed / elapsed:.1f} reg/s")
+        print(line if final else f"\r{line}", end="\n" if final else "", file=sys.stderr, flush=True)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay offline de dumps JSONL pelo mesmo fluxo do lambda_handler.")
+    parser.add_argument("files", nargs="+", help="Arquivos JSONL com um evento (payload) por linha.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Número de processos.")
+    parser.add_argument("--batch-size", type=int, default=500, help="Registros por execução do caso de uso.")
+    parser.add_argument("--checkpoint", default="replay_checkpoint.json", help="Arquivo de checkpoint por offset.")
+    parser.add_argument("--checkpoint-interval", type=float, default=5.0, help="Segundos entre gravações do checkpoint.")
+    parser.add_argument("--report-interval", type=float, default=1.0, help="Segundos entre relatórios de throughput.")
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.batch_size < 1:
+        parser.error("--workers e --batch-size devem ser maiores que zero")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    runner = ReplayRunner(
+        paths=args.files,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        checkpoint_path=args.checkpoint,
+        checkpoint_interval=args.checkpoint_interval,
+        report_interval=args.report_interval,
+    )
+    return runner.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import io
+import logging
+import threading
+import time
+from typing import List
+
+from src.cross_cutting.async_logging import AsyncLogHandler
+
+
+class BlockingHandler(logging.Handler):
+    """Handler de destino que só grava depois de liberado, mantendo a thread de flush ocupada."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        super().__init__()
+        self.lines: List[str] = []
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+        self.delay = delay
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.entered.set()
+        self.gate.wait()
+        time.sleep(self.delay)
+        self.lines.append(record.getMessage())
+
+
+def make_logger(name: str, handler: AsyncLogHandler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def test_overflow_is_counted_and_reported():
+    target = BlockingHandler()
+    handler = AsyncLogHandler([target], max_queue_size=3)
+    logger = make_logger("testar_async_log.overflow", handler)
+
+    logger.info("linha 0")
+    assert target.entered.wait(timeout=5)  # a thread está presa gravando "linha 0"
+    for i in range(1, 9):
+        logger.info("linha %d", i)
+
+    assert handler.dropped == 5
+    target.gate.set()
+    handler.flush()
+
+    assert target.lines == [
+        "linha 0", "linha 1", "linha 2", "linha 3",
+        "[AsyncLogHandler] 5 linhas de log descartadas (fila cheia)",
+    ]
+
+
+def test_flush_waits_for_every_queued_line():
+    target = BlockingHandler(delay=0.01)
+    target.gate.set()
+    handler = AsyncLogHandler([target])
+    logger = make_logger("testar_async_log.flush", handler)
+
+    for i in range(50):
+        logger.info("linha %d", i)
+    handler.flush()
+
+    assert target.lines == [f"linha {i}" for i in range(50)]
+
+
+def test_message_is_snapshotted_at_emit_time():
+    stream = io.StringIO()
+    target = logging.StreamHandler(stream)
+    target.setFormatter(logging.Formatter("%(message)s"))
+    handler = AsyncLogHandler([target])
+    logger = make_logger("testar_async_log.snapshot", handler)
+
+    data = {"status": True}
+    logger.info("%s", data)
+    data["status"] = False
+    handler.flush()
+
+    assert stream.getvalue() == "{'status': True}\n"
+
+
+if __name__ == "__main__":
+    test_overflow_is_counted_and_reported()
+    test_flush_waits_for_every_queued_line()
+    test_message_is_snapshotted_at_emit_time()
+
+    print("Teste executado com sucesso!")
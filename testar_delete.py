@@ -0,0 +1,99 @@
+from typing import Any, List, Tuple
+
+from src.features.lambda_sink.application.use_cases.process_records_use_case import ProcessRecordsUseCase
+from src.features.lambda_sink.domain.interfaces.repository_interface import IRecordRepository
+from src.features.lambda_sink.domain.mappers.mappers import EventMapper
+from src.features.lambda_sink.infrastructure.database.sql_query_builder import SimpleSQLQueryBuilder
+
+
+class FakeRecordRepository(IRecordRepository):
+    """Repositório em memória que registra as operações na ordem em que são aplicadas."""
+
+    def __init__(self) -> None:
+        self.operations: List[Tuple[str, Any]] = []
+
+    def resolve_key(self, key: Any, table_name: str) -> Tuple[Any, ...]:
+        if isinstance(key, dict):
+            return (str(key["id"]),)
+        if key is None:
+            raise ValueError("Chave nula")
+        return (str(key),)
+
+    def upsert(self, record: Any, table_name: str) -> None:
+        self.operations.append(("upsert", record["id"]))
+
+    def delete_many(self, keys: List[Any], table_name: str) -> None:
+        self.operations.append(("delete", [self.resolve_key(key, table_name)[0] for key in keys]))
+
+
+def make_record(offset: int, key: Any, record_id: int = None, status: bool = True):
+    value = None
+    if record_id is not None:
+        value = {"data": {"id": record_id, "field1": "a", "field2": "b", "field3": "c", "status": status}}
+    return EventMapper.map_event_to_sink_record(payload={
+        "topic": "test_topic",
+        "partition": 0,
+        "offset": offset,
+        "key": key,
+        "value": value,
+        "headers": {},
+        "timestamp": "2023-09-20T12:34:56Z"
+    })
+
+
+def test_inactive_records_with_same_kafka_key_are_all_deleted():
+    repository = FakeRecordRepository()
+    use_case = ProcessRecordsUseCase(repository=repository, delete_on_inactive_status=True)
+
+    use_case.execute(records=[make_record(i, None, record_id=i, status=False) for i in (1, 2, 3)])
+
+    assert repository.operations == [("delete", ["1", "2", "3"])]
+
+
+def test_delete_is_flushed_before_upsert_of_same_primary_key():
+    repository = FakeRecordRepository()
+    use_case = ProcessRecordsUseCase(repository=repository)
+
+    use_case.execute(records=[
+        make_record(0, "1", record_id=1),
+        make_record(1, "1"),             # tombstone do id 1
+        make_record(2, "2"),             # tombstone do id 2
+        make_record(3, "x", record_id=3),
+        make_record(4, "y", record_id=2),  # reinserção do id 2 com outra chave do Kafka
+        make_record(5, "4"),
+    ])
+
+    assert repository.operations == [
+        ("upsert", 1),
+        ("upsert", 3),
+        ("delete", ["1", "2"]),
+        ("upsert", 2),
+        ("delete", ["4"]),
+    ]
+
+
+def test_tombstone_without_key_is_skipped():
+    repository = FakeRecordRepository()
+    use_case = ProcessRecordsUseCase(repository=repository)
+
+    use_case.execute(records=[make_record(0, None), make_record(1, "5")])
+
+    assert repository.operations == [("delete", ["5"])]
+
+
+def test_build_delete_query():
+    builder = SimpleSQLQueryBuilder()
+
+    assert builder.build_delete_query("records", ["id"], 3) == \
+        "DELETE FROM records WHERE id IN (%s, %s, %s)"
+    assert builder.build_delete_query("records", ["tenant", "id"], 2) == \
+        "DELETE FROM records WHERE (tenant, id) IN ((%s, %s), (%s, %s))"
+
+
+if __name__ == "__main__":
+    test_inactive_records_with_same_kafka_key_are_all_deleted()
+    test_delete_is_flushed_before_upsert_of_same_primary_key()
+    test_tombstone_without_key_is_skipped()
+    test_build_delete_query()
+
+    print("Teste executado com sucesso!")
@@ -0,0 +1,89 @@
+from decimal import Decimal
+
+from src.features.lambda_sink.infrastructure.database.column_encoders import compile_column_encoders
+
+
+def make_encoders(no_backslash_escapes: bool = False):
+    metadata = [{"name": name, "type": column_type} for name, column_type in [
+        ("id", "int(11)"),
+        ("flag", "tinyint(1)"),
+        ("amount", "decimal(10,2)"),
+        ("payload", "json"),
+        ("created_at", "timestamp"),
+        ("day", "date"),
+        ("name", "varchar(255)"),
+        ("raw", "varbinary(16)"),
+    ]]
+    return compile_column_encoders(metadata, no_backslash_escapes)
+
+
+def test_tinyint_1_is_encoded_as_integer():
+    encoders = make_encoders()
+
+    assert encoders["flag"](True) == "1"
+    assert encoders["flag"](False) == "0"
+    assert encoders["flag"](2) == "2"
+    assert encoders["flag"](-5) == "-5"
+    assert encoders["id"]("42") == "42"
+    assert encoders["id"](12.0) == "12"
+
+
+def test_decimal_and_json():
+    encoders = make_encoders()
+
+    assert encoders["amount"]("1.50") == "1.50"
+    assert encoders["amount"](Decimal("2.25")) == "2.25"
+    assert make_encoders(True)["payload"]({"a": "it's"}) == "'{\"a\":\"it''s\"}'"
+    assert encoders["name"](None) == "NULL"
+
+
+def test_datetime_keeps_instant_in_session_time_zone():
+    encoders = make_encoders()
+
+    assert encoders["created_at"]("2023-09-20T12:34:56") == "'2023-09-20 12:34:56'"
+    assert encoders["created_at"]("2023-09-20T12:34:56-03:00") == \
+        "CONVERT_TZ('2023-09-20 15:34:56', '+00:00', @@session.time_zone)"
+    assert encoders["day"]("2023-09-20T23:00:00-03:00") == "'2023-09-20'"
+
+
+def test_strings_are_escaped_for_the_session_mode():
+    value = "x' OR 1=1 -- "
+
+    for no_backslash_escapes, expected in ((False, "'x\\' OR 1=1 -- '"), (True, "'x'' OR 1=1 -- '")):
+        encoders = make_encoders(no_backslash_escapes)
+        assert encoders["name"](value) == expected
+        # Colunas sem encoder dedicado também usam o quote do modo da sessão
+        assert encoders["raw"](value) == expected
+
+    assert make_encoders(True)["raw"]("x\\' OR 1=1 -- ") == "'x\\'' OR 1=1 -- '"
+
+
+def test_invalid_values_raise_value_error():
+    encoders = make_encoders()
+
+    invalid = (
+        ("id", "abc"),
+        ("id", 12.7),
+        ("id", float("inf")),
+        ("amount", "1,5"),
+        ("created_at", "ontem"),
+        ("created_at", 1e20),
+        ("payload", {"a": float("nan")}),
+        ("raw", ["a"]),
+    )
+    for column, value in invalid:
+        try:
+            encoders[column](value)
+        except ValueError:
+            continue
+        raise AssertionError(f"{column}={value!r} deveria falhar")
+
+
+if __name__ == "__main__":
+    test_tinyint_1_is_encoded_as_integer()
+    test_decimal_and_json()
+    test_datetime_keeps_instant_in_session_time_zone()
+    test_strings_are_escaped_for_the_session_mode()
+    test_invalid_values_raise_value_error()
+
+    print("Teste executado com sucesso!")
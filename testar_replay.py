@@ -0,0 +1,64 @@
+import json
+import os
+import tempfile
+
+from src.features.lambda_sink.presentation.replay_cli import ReplayRunner, iter_payloads, load_checkpoint, save_checkpoint
+
+
+def make_payload(partition: int, offset: int) -> dict:
+    return {
+        "topic": "test_topic",
+        "partition": partition,
+        "offset": offset,
+        "key": str(offset),
+        "value": {"data": {"id": offset, "field1": "a", "field2": "b", "field3": "c", "status": True}},
+        "headers": {},
+        "timestamp": "2023-09-20T12:34:56Z"
+    }
+
+
+def test_checkpoint_round_trip():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "checkpoint.json")
+
+        assert load_checkpoint(path) == {}
+
+        save_checkpoint(path, {"test_topic:0": 10, "test_topic:1": 3})
+
+        assert load_checkpoint(path) == {"test_topic:0": 10, "test_topic:1": 3}
+        assert not os.path.exists(f"{path}.tmp")
+
+
+def test_route_skips_committed_offsets():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "checkpoint.json")
+        save_checkpoint(path, {"test_topic:0": 5})
+        runner = ReplayRunner(paths=[], workers=1, batch_size=100, checkpoint_path=path,
+                              checkpoint_interval=5.0, report_interval=1.0)
+
+        for offset in range(8):
+            runner._route(make_payload(0, offset))
+        runner._route(make_payload(1, 0))
+
+        assert runner._skipped == 6
+        assert [p["offset"] for p in runner._buffers[("test_topic", 0)]] == [6, 7]
+        assert [p["offset"] for p in runner._buffers[("test_topic", 1)]] == [0]
+
+
+def test_iter_payloads_accepts_both_shapes():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "dump.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"payload": make_payload(0, 0)}) + "\n")
+            f.write("\n")
+            f.write(json.dumps(make_payload(0, 1)) + "\n")
+
+        assert [p["offset"] for p in iter_payloads([path])] == [0, 1]
+
+
+if __name__ == "__main__":
+    test_checkpoint_round_trip()
+    test_route_skips_committed_offsets()
+    test_iter_payloads_accepts_both_shapes()
+
+    print("Teste executado com sucesso!")